@@ -13,6 +13,7 @@ Specifically:
       its capabilities.
 """
 
+from functools import lru_cache
 from json import JSONDecodeError
 from os.path import getsize
 
@@ -49,6 +50,9 @@ class Mixcloud:
     information for some resource, like :meth:`embed_html`.  The class
     can be used as an asynchronous context manager to avoid having to
     call :meth:`close` explicitly, which closes the session.
+    An :class:`aiohttp.BaseConnector` can be passed for the session to
+    use, so that connections are kept alive and reused across
+    instances sharing it.
     """
 
     #: Default Mixcloud root URL
@@ -74,12 +78,21 @@ class Mixcloud:
                  json_decoder_class=json_decoder_class,
                  resource_class=resource_class,
                  resource_list_class=resource_list_class,
-                 raise_exceptions=False, session=None):
+                 raise_exceptions=False, session=None, connector=None):
         """Store instance attributes.  If no `session` is given,
-        start a new one.
+        start a new one, using `connector` if given one.  Raise
+        :exc:`ValueError` if both `session` and `connector` are given.
         """
+        if session is not None and connector is not None:
+            raise ValueError('expected either a session or a connector, '
+                             'not both')
         if session is None:
-            session = aiohttp.ClientSession()
+            if connector is None:
+                session = aiohttp.ClientSession()
+            else:
+                # Connector may be shared, leave closing it to caller.
+                session = aiohttp.ClientSession(
+                    connector=connector, connector_owner=False)
 
         #: Base URL for all API requests
         self._api_root = api_root
@@ -111,10 +124,13 @@ class Mixcloud:
         await self.close()
 
     @staticmethod
+    @lru_cache(maxsize=512)
     def _url_join(url, segment):
         """Return a :class:`~yarl.URL` consisting of `url`, followed
         by `segment`.  Strip possibly existing leading slash of
-        `segment`, for joining to work.
+        `segment`, for joining to work.  Results are cached, as
+        :class:`~yarl.URL` objects are immutable and the same URLs
+        get built over and over.
         """
         return yarl.URL(url) / segment.lstrip('/')
 
@@ -435,5 +451,7 @@ class Mixcloud:
         return await self._upload(params, data, url)
 
     async def close(self):
-        """Close :attr:`_session`."""
+        """Close :attr:`_session`.  A connector passed during
+        instantiation is left open.
+        """
         await self._session.close()
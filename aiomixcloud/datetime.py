@@ -18,21 +18,63 @@ or a timestamp.  Timezone-naive values will be treated as being in the
 local timezone.  Result will be converted in UTC, if not already there.
 """
 
+import re
 from datetime import datetime, timezone
 
 import dateutil.parser
 from dateutil.tz import tzlocal
 
 
+#: Pattern of the "YYYY-MM-DDTHH:MM:SSZ" format, used by the API
+_ISO_UTC_PATTERN = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})Z')
+
+#: Start of UNIX time
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+#: Local timezone, which timezone-naive values are treated as being in
+_LOCAL_TZ = tzlocal()
+
+
 def _as_utc(dt):
     """Convert and return given `dt` in UTC.  If it is timezone-naive,
     treat it as being in the local timezone.
     """
     if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
-        dt = dt.replace(tzinfo=tzlocal())
+        dt = dt.replace(tzinfo=_LOCAL_TZ)
     return dt.astimezone(timezone.utc)
 
 
+def _parse_api_format(value):
+    """Return a UTC :class:`~datetime.datetime` object out of `value`,
+    if it is a string in the "YYYY-MM-DDTHH:MM:SSZ" format used by
+    the API, skipping the heuristics of `dateutil`.  Otherwise return
+    ``None``.  Raise :exc:`ValueError` on out of range fields.
+    """
+    if not isinstance(value, str):
+        return None
+    match = _ISO_UTC_PATTERN.fullmatch(value)
+    if match is None:
+        return None
+    fields = map(int, match.groups())
+    return datetime(*fields, tzinfo=timezone.utc)
+
+
+def _parse_str(value):
+    """Parse human-readable datetime string `value` and return it as
+    a UTC :class:`~datetime.datetime` object.  Raise
+    :exc:`ValueError` if `value` cannot be parsed.
+    """
+    parsed = _parse_api_format(value)
+    if parsed is not None:
+        return parsed
+    if not value.strip():
+        # Nothing to parse, do not let `dateutil` try its
+        # heuristics on it.
+        raise ValueError('empty datetime string')
+    return _as_utc(dateutil.parser.parse(value))
+
+
 def _to_datetime(value):
     """Return a :class:`~datetime.datetime` object out of a
     datetime-like `value`.  Raise :exc:`TypeError` on invalid argument.
@@ -41,31 +83,35 @@ def _to_datetime(value):
         # Already a datetime, turn it to UTC and return it.
         return _as_utc(value)
 
-    try:
-        # Try to parse it as a human-readable string.
-        parsed = dateutil.parser.parse(value)
-    except (TypeError, ValueError):
-        # Try to treat it as a timestamp.
+    if isinstance(value, (str, bytes)):
         try:
-            value = int(value)
+            # Try to parse it as a human-readable string.
+            return _parse_str(value)
         except ValueError:
-            message = 'expected datetime.datetime object, valid datetime ' \
-                      'string or timestamp'
-            raise TypeError(message) from None
-        return datetime.fromtimestamp(value, timezone.utc)
+            pass
 
-    return _as_utc(parsed)
+    # Try to treat it as a timestamp.
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        message = 'expected datetime.datetime object, valid datetime ' \
+                  'string or timestamp'
+        raise TypeError(message) from None
+    return datetime.fromtimestamp(value, timezone.utc)
 
 
 def format_datetime(value):
     """Return a datetime string in the "YYYY-MM-DDTHH:MM:SSZ" format,
     out of a datetime-like `value`.
     """
-    iso = _to_datetime(value).isoformat()
-    return f'{iso[:-6]}Z'
+    dt = _to_datetime(value)
+    return (f'{dt.year:04}-{dt.month:02}-{dt.day:02}T'
+            f'{dt.hour:02}:{dt.minute:02}:{dt.second:02}Z')
 
 
 def to_timestamp(value):
     """Return a UNIX timestamp out of a datetime-like `value`."""
-    timestamp = _to_datetime(value).timestamp()
-    return int(timestamp)
+    # Result of `_to_datetime` is always in UTC, so there is no need
+    # for `datetime.timestamp` to take local time into account.
+    delta = _to_datetime(value) - _EPOCH
+    return int(delta.total_seconds())
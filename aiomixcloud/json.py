@@ -13,6 +13,8 @@ from json import JSONDecoder
 
 import dateutil.parser
 
+from aiomixcloud.datetime import _parse_api_format
+
 
 class MixcloudJSONDecoder(JSONDecoder):
     """Handles datetime values."""
@@ -28,8 +30,14 @@ class MixcloudJSONDecoder(JSONDecoder):
         """
         result = {}
         for k, v in obj.items():
+            if not isinstance(v, str):
+                # Only strings can be datetime-like, skip `dateutil`.
+                result[k] = v
+                continue
             try:
-                value = dateutil.parser.parse(v)
+                value = _parse_api_format(v)
+                if value is None:
+                    value = dateutil.parser.parse(v)
             except (TypeError, ValueError):
                 # Not a datetime-like string, just keep original value.
                 value = v
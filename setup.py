@@ -23,6 +23,7 @@ setup(
     url='https://github.com/amikrop/aiomixcloud',
     packages=['aiomixcloud'],
     license='MIT',
+    python_requires='>=3.8',
     install_requires=[
         'aiohttp',
         'python-dateutil',
@@ -35,8 +36,6 @@ setup(
         'Operating System :: OS Independent',
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
-        'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
         'Programming Language :: Python :: 3 :: Only',
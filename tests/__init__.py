@@ -0,0 +1,13 @@
+import asyncio
+import atexit
+from pathlib import Path
+
+
+#: Event loop shared by the whole test suite, set as the current one
+#: before any test module gets imported
+LOOP = asyncio.new_event_loop()
+asyncio.set_event_loop(LOOP)
+atexit.register(LOOP.close)
+
+#: Directory of JSON fixtures, found regardless of the working directory
+FIXTURES = Path(__file__).parent / 'fixtures'
@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 from tests.mock import AsyncContextManagerMock
 
@@ -8,13 +8,11 @@ def configure_mock_session(mock_session_class, coroutine):
     mock class, with proper asynchronous context management behavior,
     specified by `coroutine`.
     """
-    async def close():
-        """Dumy coroutine function."""
-
     mock_session = mock_session_class.return_value
     mock_session.get = AsyncContextManagerMock()
-    mock_session.get.return_value.aenter.json.return_value = coroutine()
-    mock_session.close.return_value = close()
+    mock_session.get.return_value.aenter.json = AsyncMock(
+        side_effect=coroutine)
+    mock_session.close = AsyncMock()
     return mock_session
 
 
@@ -24,7 +22,8 @@ def make_mock_mixcloud(coroutine):
     """
     mock = Mock()
     mock._session.get = AsyncContextManagerMock()
-    mock._session.get.return_value.aenter.json.return_value = coroutine()
+    mock._session.get.return_value.aenter.json = AsyncMock(
+        side_effect=coroutine)
     return mock
 
 
@@ -1,19 +1,41 @@
+import io
 import json
-import os
-from os.path import basename
-from pathlib import Path
-from tempfile import NamedTemporaryFile, mkstemp
-from unittest.mock import Mock, patch
+from types import MappingProxyType
+from unittest.mock import AsyncMock, Mock, patch
 
 import aiohttp
 import yarl
 from multidict import MultiDict
 
+from aiomixcloud.constants import API_ROOT
 from aiomixcloud.models import AccessDict
 
+from tests import FIXTURES
 from tests.mock import AsyncContextManagerMock
 
 
+#: Sample resource data, read-only so no test can alter it for the rest
+SAMPLE_DICT = MappingProxyType(
+    {'username': 'chris', 'key': '/chris/', 'type': 'user'})
+
+#: Sample error response data, read-only as well
+ERROR_DICT = MappingProxyType({'error': {'message': 'problem'}})
+
+#: Segments passed to `_build_url`, along with the path each one
+#: is expected to end up as
+URL_VALUES = (
+    ('', ''),
+    ('foo', 'foo'),
+    ('hello/', 'hello/'),
+    ('/something', 'something'),
+    ('/bar/', 'bar/'),
+    ('this/that', 'this/that'),
+    ('hello/world/', 'hello/world/'),
+    ('/one/two', 'one/two'),
+    ('/abcd/efgh/', 'abcd/efgh/'),
+)
+
+
 def urljoin(root, path):
     """Join `root` and `path` into a single URL.  `path` is expected
     not to start from a slash.
@@ -22,60 +44,94 @@ def urljoin(root, path):
     return f'{root}/{path}'
 
 
+def patch_open(path):
+    """Patch `open` of `aiomixcloud.core` to return an in-memory
+    file named `path`, instead of touching the filesystem.
+    """
+    file = io.BytesIO()
+    file.name = path
+    return patch('aiomixcloud.core.open', return_value=file, create=True)
+
+
 class TestMixcloudMixin:
     """Mixin testcase for `Mixcloud`-like classes."""
 
+    sample_dict = SAMPLE_DICT
+    error_dict = ERROR_DICT
+    url_values = URL_VALUES
+
     @classmethod
     def setUpClass(cls):
-        """Store test data and create and store patcher."""
-        cls.url_values = [
-            ('', ''),
-            ('foo', 'foo'),
-            ('hello/', 'hello/'),
-            ('/something', 'something'),
-            ('/bar/', 'bar/'),
-            ('this/that', 'this/that'),
-            ('hello/world/', 'hello/world/'),
-            ('/one/two', 'one/two'),
-            ('/abcd/efgh/', 'abcd/efgh/'),
-        ]
-        cls.sample_dict = {'username': 'chris',
-                           'key': '/chris/', 'type': 'user'}
-        cls.error_dict = {'error': {'message': 'problem'}}
-        cls.patcher = patch('aiohttp.ClientSession', autospec=True)
+        """Store test data, loading JSON fixtures once, start
+        patcher, storing mocked session class and registering its
+        stop as a class cleanup, and create the
+        asynchronous context managers of session methods and the
+        `Mixcloud`-like object shared by all tests.
+        """
+        cls.build_url_values = [
+            (value, yarl.URL(urljoin(API_ROOT, path)))
+            for value, path in cls.url_values]
+        cls.custom_build_url_values = [
+            (value, yarl.URL(urljoin(cls.custom_api_root, path)))
+            for value, path in cls.url_values]
+        cls.json_decode_error = json.JSONDecodeError('Expecting value', '', 0)
+        # `json.loads` accepts bytes, skip wrapping files in text mode.
+        cls.comments_data = json.loads(
+            (FIXTURES / 'comments.json').read_bytes())
+        cls.followers_data = json.loads(
+            (FIXTURES / 'followers.json').read_bytes())
+        cls.patcher = patch('aiohttp.ClientSession')
+        cls.mock_session_class = cls.patcher.start()
+        # Registered right away, so that the patch is undone even if
+        # the rest of class setup fails.
+        cls.addClassCleanup(cls.patcher.stop)
+        # Only the session methods used by `Mixcloud` are needed,
+        # avoid autospeccing the whole of `ClientSession`.
+        cls.mock_session_class.return_value = Mock(
+            spec_set=['get', 'post', 'delete', 'close'])
+        cls.session_contexts = {name: AsyncContextManagerMock()
+                                for name in ('get', 'post', 'delete')}
+        cls.get_context = cls.session_contexts['get']
+        cls.shared_mixcloud = cls.mixcloud_class()
+        # Synchronous versions keep the actual object in `_object`.
+        mixcloud_object = getattr(
+            cls.shared_mixcloud, '_object', cls.shared_mixcloud)
+        cls.mixcloud_state = vars(mixcloud_object)
+        cls.initial_mixcloud_state = cls.mixcloud_state.copy()
 
     def setUp(self):
-        """Start patcher, store mocked session object, store result of
-        GET asynchronous context management and set mocked session
-        object's `close` method to a noop.
+        """Reset mocked session class, store mocked session object,
+        reset and store result of the shared GET asynchronous context
+        management, replace mocked session object's `close` method
+        with an `AsyncMock` and restore the shared `Mixcloud`-like
+        object to its initial state.
         """
-        async def coroutine():
-            """Return sample `AccessDict`."""
-            return AccessDict(self.sample_dict, mixcloud=self.mixcloud)
-
-        async def close():
-            """Dummy coroutine function."""
-
-        mock_session_class = self.patcher.start()
-
-        self.mock_session = mock_session_class.return_value
-        self.response_get = self.configure_session_method(
-            self.mock_session.get)
-        self.mock_session.close = close
-
-        self.mixcloud = self.mixcloud_class()
-        self.coroutine = coroutine
-
-    def tearDown(self):
-        """Stop patcher."""
-        self.patcher.stop()
-
-    def configure_session_method(self, method):
-        """Configure `method` to return an asynchronous context
-        manager and return its `__aenter__` value.
+        self.mock_session_class.reset_mock()
+
+        self.mock_session = self.mock_session_class.return_value
+        self.mock_session.get.return_value = self.get_context
+        self.response_get = self.get_context.aenter
+        self.response_get.reset_mock(return_value=True, side_effect=True)
+        self.mock_session.close = AsyncMock()
+
+        # Drop whatever previous tests set on the shared instance.
+        self.mixcloud_state.clear()
+        self.mixcloud_state.update(self.initial_mixcloud_state)
+        self.mixcloud = self.shared_mixcloud
+
+    def sample_access_dict(self):
+        """Return an `AccessDict` of sample data."""
+        return AccessDict(self.sample_dict, mixcloud=self.mixcloud)
+
+    def configure_session_method(self, method_name):
+        """Configure mocked session's `method_name` method to return
+        its shared asynchronous context manager and return the reset
+        `__aenter__` value of the latter.
         """
-        method.return_value = AsyncContextManagerMock()
-        return method.return_value.aenter
+        context = self.session_contexts[method_name]
+        getattr(self.mock_session, method_name).return_value = context
+        context.aenter.reset_mock(return_value=True, side_effect=True)
+        return context.aenter
 
     def test_url_join(self):
         """`_url_join` must return an absolute URL consisting of two
@@ -97,16 +153,16 @@ class TestMixcloudMixin:
         """`_build_url` must return an absolute URL consisting of
         `_api_root` and given argument.
         """
-        for value, path in self.url_values:
+        for value, expected in self.build_url_values:
             result = self.mixcloud._build_url(value)
-            expected = urljoin(self.mixcloud._api_root, path)
-            self.assertEqual(result, yarl.URL(expected))
+            self.assertEqual(result, expected)
 
-    def configure_get_json(self, coroutine):
-        """Set `coroutine`'s result as return value of asynchronously
-        context-managed mock session's `json` method.
+    def set_get_json(self, value=None, *, exception=None):
+        """Make asynchronously context-managed mock session's `json`
+        method return `value`, or raise `exception` if it is given.
         """
-        self.response_get.json.return_value = coroutine()
+        self.response_get.json = AsyncMock(return_value=value,
+                                           side_effect=exception)
 
     def test_get(self):
         """`get` must, under normal circumstances, return a
@@ -130,35 +186,28 @@ class TestMixcloudMixin:
         """`get` must return a `ResourceList`-like object of received
         data when that data contains a 'data' key.
         """
-        filename = Path('tests') / 'fixtures' / 'followers.json'
-        with filename.open() as f:
-            data = json.load(f)
-        self.check_get('/luke/', data, self.resource_list_class)
+        self.check_get('/luke/', self.followers_data,
+                       self.resource_list_class)
 
-    def test_me(self):
-        """`me` must return `get` called with 'me'."""
-        self.mixcloud.access_token = '51sq'
-        self.check_shortcut('me', 'me')
-
-    def test_discover(self):
-        """`discover` must return `get` called with 'discover/'
-        concatenated with given tag.
+    def test_shortcuts(self):
+        """`me` and `discover` must return `get` called with 'me' and
+        'discover/' concatenated with given tag, respectively.
         """
-        self.check_shortcut('discover', 'discover/jazz', 'jazz')
+        self.mixcloud.access_token = '51sq'
+        values = [
+            ('me', 'me', ()),
+            ('discover', 'discover/jazz', ('jazz',)),
+        ]
+        for method_name, called_with, args in values:
+            with self.subTest(method=method_name):
+                self.check_shortcut(method_name, called_with, *args)
 
     def shortcut_prepare(self):
         """Prepare test data for a shortcut method."""
-        filename = Path('tests') / 'fixtures' / 'comments.json'
-        with filename.open() as f:
-            self.shortcut_data = json.load(f)
-
-        async def coroutine():
-            """Return sample `ResourceList`-like object."""
-            return self.resource_list_class(
-                self.shortcut_data, mixcloud=self.mixcloud)
-
-        self.mixcloud.get = Mock()
-        self.mixcloud.get.return_value = coroutine()
+        self.shortcut_data = self.comments_data
+        self.mock_get = self.mixcloud.get = AsyncMock(
+            return_value=self.resource_list_class(
+                self.shortcut_data, mixcloud=self.mixcloud))
 
     def assert_resource_list_equal(self, value):
         """Check that `value` is a `ResourceList`-like object with its
@@ -169,12 +218,9 @@ class TestMixcloudMixin:
 
     def prepare_process_response(self, value):
         """Configure and store mock `_process_response`."""
-        async def coroutine():
-            """Return result of mock `_process_response`."""
-            return value
-
-        self.mock_process_response = self.mixcloud._process_response = Mock()
-        self.mock_process_response.return_value = coroutine()
+        mock_process_response = AsyncMock(return_value=value)
+        self.mock_process_response = mock_process_response
+        self.mixcloud._process_response = mock_process_response
 
     def assert_access_dict_equal(self, value, expected):
         """Assert that `value` is an `AccessDict` with its `data`
@@ -195,63 +241,17 @@ class TestMixcloudMixin:
         """
         self.check_make_action('delete')
 
-    def check_post_action(self, action_name):
-        """Check that POST method about action `action_name`
-        works correctly.
-        """
-        self.check_specific_action('post', action_name)
-
-    def check_delete_action(self, action_name):
-        """Check that DELETE method about action `action_name`
-        works correctly.
-        """
-        self.check_specific_action('delete', f'un{action_name}')
-
-    def test_follow(self):
-        """`follow` must return `_post_action` called with 'follow'."""
-        self.check_post_action('follow')
-
-    def test_favorite(self):
-        """`favorite` must return `_post_action` called
-        with 'favorite'.
-        """
-        self.check_post_action('favorite')
-
-    def test_repost(self):
-        """`repost` must return `._post_action` called
-        with 'repost'.
-        """
-        self.check_post_action('repost')
-
-    def test_listen_later(self):
-        """`listen_later` must return `_post_action` called
-        with 'listen-later'.
-        """
-        self.check_post_action('listen_later')
-
-    def test_unfollow(self):
-        """`unfollow` must return `_delete_action` called
-        with 'follow'.
+    def test_actions(self):
+        """Each action method must return `_post_action`, or
+        `_delete_action` for the "un"-prefixed ones, called with the
+        respective action.
         """
-        self.check_delete_action('follow')
-
-    def test_unfavorite(self):
-        """`unfavorite` must return `_delete_action` called
-        with 'favorite'.
-        """
-        self.check_delete_action('favorite')
-
-    def test_unrepost(self):
-        """`unrepost` must return `_delete_action` called
-        with 'repost'.
-        """
-        self.check_delete_action('repost')
-
-    def test_unlisten_later(self):
-        """`unlisten_later` must return `_delete_action` called
-        with 'listen-later'.
-        """
-        self.check_delete_action('listen_later')
+        action_names = ['follow', 'favorite', 'repost', 'listen_later']
+        for action_name in action_names:
+            with self.subTest(action=action_name):
+                self.check_specific_action('post', action_name)
+            with self.subTest(action=f'un{action_name}'):
+                self.check_specific_action('delete', f'un{action_name}')
 
     def test_underscore_upload(self):
         """`_upload` must go through `_session.post` of the proper URL,
@@ -276,32 +276,32 @@ class TestMixcloudMixin:
         form POST parameters in a proper way and call `_native_result`,
         when `picture` argument is passed.
         """
-        with NamedTemporaryFile() as f:
-            params = {'picture': f.name, 'tags': ['jazz', 'smooth'],
-                      'sections': [{'artist': 'cool dj', 'start_time': 15}]}
-            data = aiohttp.FormData({'name': 'My show'})
-            expected_fields = [
-                (MultiDict({'name': 'name'}), {}, 'My show'),
-                (MultiDict({'name': 'tags-0-tag'}), {}, 'jazz'),
-                (MultiDict({'name': 'tags-1-tag'}), {}, 'smooth'),
-                (MultiDict({'name': 'sections-0-artist'}), {}, 'cool dj'),
-                (MultiDict({'name': 'sections-0-start_time'}), {}, '15')]
+        path = '/pictures/show.jpg'
+        params = {'picture': path, 'tags': ['jazz', 'smooth'],
+                  'sections': [{'artist': 'cool dj', 'start_time': 15}]}
+        data = aiohttp.FormData({'name': 'My show'})
+        expected_fields = [
+            (MultiDict({'name': 'name'}), {}, 'My show'),
+            (MultiDict({'name': 'tags-0-tag'}), {}, 'jazz'),
+            (MultiDict({'name': 'tags-1-tag'}), {}, 'smooth'),
+            (MultiDict({'name': 'sections-0-artist'}), {}, 'cool dj'),
+            (MultiDict({'name': 'sections-0-start_time'}), {}, '15')]
 
+        with patch_open(path):
             self.check_underscore_upload(
                 params, data, '93gq', expected_fields,
-                picture_filename=basename(f.name))
+                picture_filename='show.jpg')
 
     def test_upload(self):
         """`upload` must work correctly, going through `_upload`."""
-        _, path = mkstemp()
-        try:
-            url = urljoin(self.mixcloud._api_root, 'upload/')
-            expected_fields = [(MultiDict({'name': 'name'}), {}, 'test')]
+        path = '/music/test.mp3'
+        url = urljoin(self.mixcloud._api_root, 'upload/')
+        expected_fields = [(MultiDict({'name': 'name'}), {}, 'test')]
+        with patch_open(path), \
+                patch('aiomixcloud.core.getsize', return_value=1024):
             self.check_upload('b69p', 'upload', {'description': 'testing'},
-                              url, expected_fields, basename(path), path,
+                              url, expected_fields, 'test.mp3', path,
                               'test', description='testing')
-        finally:
-            os.remove(path)
 
     def test_edit(self):
         """`edit` must work correctly, going through `_upload`."""
@@ -316,17 +316,12 @@ class TestMixcloudMixin:
         the URL with help of data returned by `me`, when `key` does not
         include the user's key.
         """
-        async def coroutine():
-            """Return data containing a "key" key."""
-            return {'key': 'myself'}
-
-        mock_me = self.mixcloud.me = Mock()
-        mock_me.return_value = coroutine()
+        mock_me = self.mixcloud.me = AsyncMock(return_value={'key': 'myself'})
 
         url = urljoin(self.mixcloud._api_root, 'upload/myself/mymix/edit/')
         self.check_upload('kf3p', 'edit', {'tags': ['baz']},
                           url, [], None, 'mymix', tags=['baz'])
-        mock_me.assert_called_once_with()
+        mock_me.assert_awaited_once_with()
 
     def test_edit_name(self):
         """`edit` must work correctly, going through `_upload`, when
@@ -35,7 +35,7 @@ class TestMixcloudOAuthSync(TestMixcloudOAuthMixin, VerboseTestCase):
                 yarl.URL('https://www.mixcloud.com/oauth/access_token'),
                 params={'client_id': 'gb7', 'redirect_uri': 'test.com',
                         'client_secret': '5rf', 'code': 'qtc'})
-            mock_session.close.assert_called_once_with()
+            mock_session.close.assert_awaited_once_with()
         self.assertEqual(result, 'kc3h')
 
     def test_access_token_mixcloud_instance(self):
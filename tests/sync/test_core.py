@@ -1,35 +1,33 @@
 import json
-import os
-from os.path import basename
-from pathlib import Path
-from tempfile import NamedTemporaryFile, mkstemp
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import aiohttp
 import yarl
 from multidict import MultiDict
 
 from aiomixcloud import MixcloudError
+from aiomixcloud.constants import API_ROOT
 from aiomixcloud.sync import MixcloudSync, ResourceSync, ResourceListSync
 from aiomixcloud.models import AccessDict, Resource
 
 from tests.core import TestMixcloudMixin, urljoin
-from tests.mock import AsyncContextManagerMock
 from tests.verbose import VerboseTestCase
 
 
-def shortcut_list_check(method):
-    """Return a wrapper that prepares before and tests after
-    calling `method`.
-    """
-    def wrapper(self):
-        """Prepare test data, call `method` and assert about
-        its result.
-        """
-        self.shortcut_prepare()
-        result = method(self)
-        self.assert_resource_list_equal(result)
-    return wrapper
+#: Expected URL of GET requests with an access token
+_GET_ACCESS_TOKEN_URL = yarl.URL(urljoin(
+    API_ROOT, 'foo/baz?metadata=1&access_token=ht6w'))
+
+#: Expected URL of GET requests with parameters
+_GET_PARAMS_URL = yarl.URL(urljoin(
+    API_ROOT, 'auser/ashow?foo=test&height=5&metadata=1'))
+
+#: Expected URL of action requests
+_ACTION_URL = yarl.URL(urljoin(
+    API_ROOT, 'bob/myshow/favorite/?access_token=dh7i'))
+
+#: Expected URL of embed requests
+_EMBED_URL = yarl.URL(urljoin(API_ROOT, 'someuser/somemix/embed-json'))
 
 
 class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
@@ -38,6 +36,7 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
     mixcloud_class = MixcloudSync
     resource_class = ResourceSync
     resource_list_class = ResourceListSync
+    custom_api_root = 'https://api.mxcd.com'
 
     def test_pass_session(self):
         """`MixcloudSync` must store a custom session, if one is passed
@@ -56,23 +55,19 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
     def test_build_url_api_root(self):
         """`MixcloudSync._build_url` must return an absolute URL
         consisting of `_api_root` and given argument, when using a
-        custom `_api_root`.
+        custom `_api_root`, returning the same object on repeated calls.
         """
-        with MixcloudSync('https://api.mxcd.com') as mixcloud:
-            for value, path in self.url_values:
+        with MixcloudSync(self.custom_api_root) as mixcloud:
+            for value, expected in self.custom_build_url_values:
                 result = mixcloud._build_url(value)
-                expected = f'https://api.mxcd.com/{path}'
-                self.assertEqual(result, yarl.URL(expected))
+                self.assertEqual(result, expected)
+                self.assertIs(mixcloud._build_url(value), result)
 
     def test_process_response(self):
         """`MixcloudSync._process_respose` must return a dict of
         received data.
         """
-        @self.configure_get_json
-        async def coroutine():
-            """Return sample dict."""
-            return self.sample_dict
-
+        self.set_get_json(self.sample_dict)
         result = self.mixcloud._process_response(self.response_get)
         self.response_get.json.assert_called_once_with(
             loads=self.mixcloud._json_decode, content_type=None)
@@ -82,11 +77,7 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
         """`MixcloudSync._process_respose` must return None when JSON
         decoding fails and `_raise_exceptions` is False.
         """
-        @self.configure_get_json
-        async def coroutine():
-            """Raise JSONDecodeError."""
-            json.loads('')
-
+        self.set_get_json(exception=self.json_decode_error)
         result = self.mixcloud._process_response(self.response_get)
         self.assertIsNone(result)
 
@@ -94,11 +85,7 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
         """`MixcloudSync._process_respose` must raise JSONDecodeError when
         JSON decoding fails and `_raise_exceptions` is True.
         """
-        @self.configure_get_json
-        async def coroutine():
-            """Raise JSONDecodeError."""
-            json.loads('')
-
+        self.set_get_json(exception=self.json_decode_error)
         with MixcloudSync(raise_exceptions=True) as mixcloud:
             with self.assertRaises(json.JSONDecodeError):
                 mixcloud._process_response(self.response_get)
@@ -112,11 +99,7 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
         if expected is None:
             expected = value
 
-        @self.configure_get_json
-        async def coroutine():
-            """Return mock `_process_result`'s result."""
-            return value
-
+        self.set_get_json(value)
         result = self.mixcloud.get(key)
 
         self.mock_session.get.assert_called_once_with(
@@ -133,56 +116,35 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
              'https://api.mixcloud.com/someone/cloudcasts?metadata=1'),
         ]
         for value, url in values:
-            @self.configure_get_json
-            async def coroutine():
-                """Dummy coroutine function."""
-
+            self.set_get_json()
             self.mixcloud.get(value, relative=False)
 
-            self.mock_session.get.assert_called_with(
-                yarl.URL(url))
-        self.assertEqual(self.mock_session.get.call_count, len(values))
+        expected_calls = [call(yarl.URL(url)) for _, url in values]
+        self.assertEqual(self.mock_session.get.call_args_list, expected_calls)
 
     def test_get_access_token(self):
         """`MixcloudSync.get` must include access token as a GET parameter,
         if it is not None.
         """
-        @self.configure_get_json
-        async def coroutine():
-            """Dummy coroutine function."""
-
+        self.set_get_json()
         self.mixcloud.access_token = 'ht6w'
         self.mixcloud.get('foo/baz')
-        expected = urljoin(
-            self.mixcloud._api_root,
-            'foo/baz?metadata=1&access_token=ht6w')
 
         self.mock_session.get.assert_called_once_with(
-            yarl.URL(expected))
+            _GET_ACCESS_TOKEN_URL)
 
     def test_get_params(self):
         """`MixcloudSync.get` must correctly handle GET parameters."""
-        @self.configure_get_json
-        async def coroutine():
-            """Dummy coroutine function."""
-
+        self.set_get_json()
         self.mixcloud.get('auser/ashow', foo='test', height=5)
-        expected = urljoin(
-            self.mixcloud._api_root,
-            'auser/ashow?foo=test&height=5&metadata=1')
 
-        self.mock_session.get.assert_called_once_with(
-            yarl.URL(expected))
+        self.mock_session.get.assert_called_once_with(_GET_PARAMS_URL)
 
     def test_get_error_raise_exception(self):
         """`MixcloudSync.get` must raise a MixcloudError when received
         data has an 'error' key and `_raise_exceptions` is True.
         """
-        @self.configure_get_json
-        async def coroutine():
-            """Return mock `_process_result`'s expected result."""
-            return self.error_dict
-
+        self.set_get_json(self.error_dict)
         with MixcloudSync(raise_exceptions=True) as mixcloud:
             with self.assertRaises(MixcloudError):
                 mixcloud.get('testing')
@@ -192,58 +154,46 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
 
     def check_shortcut(self, method_name, called_with, *args):
         """Check that shortcut method `method_name` works correctly."""
-        async def coroutine():
-            """Return sample `ResourceSync`."""
-            return ResourceSync(self.sample_dict, mixcloud=self.mixcloud)
-
-        self.mixcloud.get = Mock()
-        self.mixcloud.get.return_value = coroutine()
+        mock_get = self.mixcloud.get = AsyncMock(return_value=ResourceSync(
+            self.sample_dict, mixcloud=self.mixcloud))
         method = getattr(self.mixcloud, method_name)
         result = method(*args)
 
-        self.mixcloud.get.assert_called_once_with(called_with)
+        mock_get.assert_awaited_once_with(called_with)
         self.assertIsInstance(result, ResourceSync)
         self.assertEqual(result.data, self.sample_dict)
 
-    @shortcut_list_check
-    def test_popular(self):
-        """`MixcloudSync.popular` must return `MixcloudSync.get` called with
-        appropriate parameters.
+    def check_list_shortcut(self, method_name, args, kwargs, called_with):
+        """Check that list shortcut method `method_name`, when called
+        with `args` and `kwargs`, returns the result of `get` called
+        as described by `called_with`.
         """
-        result = self.mixcloud.popular(offset=40, limit=20)
-        self.mixcloud.get.assert_called_once_with(
-            'popular', offset=40, limit=20)
-        return result
-
-    @shortcut_list_check
-    def test_hot(self):
-        """`MixcloudSync.hot` must return `MixcloudSync.get` called with
-        appropriate parameters.
-        """
-        result = self.mixcloud.hot(page=4)
-        self.mixcloud.get.assert_called_once_with(
-            'popular/hot', offset=80, limit=20)
-        return result
-
-    @shortcut_list_check
-    def test_new(self):
-        """`MixcloudSync.new` must return `MixcloudSync.get` called with
-        appropriate parameters.
-        """
-        result = self.mixcloud.new(since=10000, until=200000)
-        self.mixcloud.get.assert_called_once_with(
-            'new', since=10000, until=200000)
-        return result
-
-    @shortcut_list_check
-    def test_search(self):
-        """`MixcloudSync.search` must return `MixcloudSync.get` called with
-        appropriate parameters.
+        self.shortcut_prepare()
+        method = getattr(self.mixcloud, method_name)
+        result = method(*args, **kwargs)
+
+        self.assertEqual(self.mock_get.call_args_list, [called_with])
+        self.assert_resource_list_equal(result)
+
+    def test_list_shortcuts(self):
+        """`MixcloudSync.popular`, `hot`, `new` and `search` must return
+        `MixcloudSync.get` called with appropriate parameters.
         """
-        result = self.mixcloud.search('sample', offset=80, limit=40)
-        self.mixcloud.get.assert_called_once_with(
-            'search', q='sample', type='cloudcast', offset=80, limit=40)
-        return result
+        values = [
+            ('popular', (), {'offset': 40, 'limit': 20},
+             call('popular', offset=40, limit=20)),
+            ('hot', (), {'page': 4},
+             call('popular/hot', offset=80, limit=20)),
+            ('new', (), {'since': 10000, 'until': 200000},
+             call('new', since=10000, until=200000)),
+            ('search', ('sample',), {'offset': 80, 'limit': 40},
+             call('search', q='sample', type='cloudcast',
+                  offset=80, limit=40)),
+        ]
+        for method_name, args, kwargs, called_with in values:
+            with self.subTest(method=method_name):
+                self.check_list_shortcut(
+                    method_name, args, kwargs, called_with)
 
     def check_native_result(self, value, expected):
         """Check that `_native_result` goes through `_process_response`
@@ -252,7 +202,7 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
         self.prepare_process_response(value)
         result = self.mixcloud._native_result('response')
 
-        self.mock_process_response.assert_called_once_with('response')
+        self.mock_process_response.assert_awaited_once_with('response')
         self.assert_access_dict_equal(result, expected)
 
     def test_native_result(self):
@@ -284,7 +234,7 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
 
         with self.assertRaises(MixcloudError):
             self.mixcloud._native_result('response')
-        self.mock_process_response.assert_called_once_with('response')
+        self.mock_process_response.assert_awaited_once_with('response')
 
     def test_do_action(self):
         """`MixcloudSync._do_action` must, under normal circumstances,
@@ -293,23 +243,17 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
         """
         methods = ['post', 'delete']
         for method_name in methods:
-            async def coroutine():
-                """Return sample `AccessDict`."""
-                return AccessDict(self.sample_dict, mixcloud=self.mixcloud)
-
             method = getattr(self.mock_session, method_name)
-            response = self.configure_session_method(method)
+            response = self.configure_session_method(method_name)
             self.mixcloud.access_token = 'dh7i'
 
-            mock_native_result = self.mixcloud._native_result = Mock()
-            mock_native_result.return_value = coroutine()
+            mock_native_result = self.mixcloud._native_result = AsyncMock(
+                return_value=self.sample_access_dict())
             result = self.mixcloud._do_action(
                 'bob/myshow', 'favorite', method_name)
-            expected_url = urljoin(self.mixcloud._api_root,
-                                   'bob/myshow/favorite/?access_token=dh7i')
 
-            method.assert_called_once_with(yarl.URL(expected_url))
-            mock_native_result.assert_called_once_with(response)
+            method.assert_called_once_with(_ACTION_URL)
+            mock_native_result.assert_awaited_once_with(response)
             self.assert_access_dict_equal(result, self.sample_dict)
 
     def test_do_action_failure(self):
@@ -323,12 +267,12 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
         """Check that `MixcloudSync`'s HTTP `method` request about some
         action works corectly.
         """
-        mock_do_action = self.mixcloud._do_action = Mock()
-        mock_do_action.return_value = self.coroutine()
+        mock_do_action = self.mixcloud._do_action = AsyncMock(
+            return_value=self.sample_access_dict())
         method = getattr(self.mixcloud, f'_{method_name}_action')
         result = method('test', 'follow')
 
-        mock_do_action.assert_called_once_with('test', 'follow', method_name)
+        mock_do_action.assert_awaited_once_with('test', 'follow', method_name)
         self.assert_access_dict_equal(result, self.sample_dict)
 
     def check_specific_action(self, method_name, action_name):
@@ -336,9 +280,8 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
         action `action_name` works correctly.
         """
         attribute = f'_{method_name}_action'
-        setattr(self.mixcloud, attribute, Mock())
-        mock_method = getattr(self.mixcloud, attribute)
-        mock_method.return_value = self.coroutine()
+        mock_method = AsyncMock(return_value=self.sample_access_dict())
+        setattr(self.mixcloud, attribute, mock_method)
         action = getattr(self.mixcloud, action_name)
         result = action('foo')
 
@@ -346,7 +289,7 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
             action_name = action_name[2:]
         action_name = action_name.replace('_', '-')
 
-        mock_method.assert_called_once_with('foo', action_name)
+        mock_method.assert_awaited_once_with('foo', action_name)
         self.assert_access_dict_equal(result, self.sample_dict)
 
     def test_proper_result(self):
@@ -355,65 +298,56 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
         """
         mock_response = Mock()
         mock_response.headers = {'content-type': 'application/javascript'}
-        mock_native_result = self.mixcloud._native_result = Mock()
-        mock_native_result.return_value = self.coroutine()
+        mock_native_result = self.mixcloud._native_result = AsyncMock(
+            return_value=self.sample_access_dict())
         result = self.mixcloud._proper_result(mock_response)
 
-        mock_native_result.assert_called_once_with(mock_response)
+        mock_native_result.assert_awaited_once_with(mock_response)
         self.assert_access_dict_equal(result, self.sample_dict)
 
     def test_proper_result_text(self):
         """`MixcloudSync._proper_result` must call response's `text` method
         when dealing with text data.
         """
-        async def coroutine():
-            """Return sample text."""
-            return 'sample'
-
         mock_response = Mock(headers={})
-        mock_response.text.return_value = coroutine()
+        mock_response.text = AsyncMock(return_value='sample')
         result = self.mixcloud._proper_result(mock_response)
 
-        mock_response.text.assert_called_once_with()
+        mock_response.text.assert_awaited_once_with()
         self.assertEqual(result, 'sample')
 
     def test_embed(self):
         """`MixcloudSync._embed` must go through `_session.get` of the
         proper URL and call `_proper_result`.
         """
-        mock_proper_result = self.mixcloud._proper_result = Mock()
-        mock_proper_result.return_value = self.coroutine()
+        mock_proper_result = self.mixcloud._proper_result = AsyncMock(
+            return_value=self.sample_access_dict())
         result = self.mixcloud._embed('someuser/somemix', height=70)
 
-        url = urljoin(self.mixcloud._api_root, 'someuser/somemix/embed-json')
         self.mock_session.get.assert_called_once_with(
-            yarl.URL(url), params={'height': 70})
+            _EMBED_URL, params={'height': 70})
+        mock_proper_result.assert_awaited_once_with(self.response_get)
         self.assert_access_dict_equal(result, self.sample_dict)
 
     def test_embed_json(self):
         """`MixcloudSync.embed_json` must call `_embed` with format='json'
         and any other arguments forwarded.
         """
-        mock_embed = self.mixcloud._embed = Mock()
-        mock_embed.return_value = self.coroutine()
+        mock_embed = self.mixcloud._embed = AsyncMock(
+            return_value=self.sample_access_dict())
         result = self.mixcloud.embed_json(width=260)
 
-        mock_embed.assert_called_once_with(format='json', width=260)
+        mock_embed.assert_awaited_once_with(format='json', width=260)
         self.assert_access_dict_equal(result, self.sample_dict)
 
     def test_embed_html(self):
         """`MixcloudSync.embed_html` must call `_embed` with format='html'
         and any other arguments forwarded.
         """
-        async def coroutine():
-            """Return sample text."""
-            return 'test'
-
-        mock_embed = self.mixcloud._embed = Mock()
-        mock_embed.return_value = coroutine()
+        mock_embed = self.mixcloud._embed = AsyncMock(return_value='test')
         result = self.mixcloud.embed_html(width=320)
 
-        mock_embed.assert_called_once_with(format='html', width=320)
+        mock_embed.assert_awaited_once_with(format='html', width=320)
         self.assertEqual(result, 'test')
 
     def test_oembed(self):
@@ -422,19 +356,15 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
         """
         xml = '<?xml version="1.0" encoding="utf-8"?><oembed>baz</oembed>'
 
-        async def coroutine():
-            """Return sample XML."""
-            return xml
-
-        mock_proper_result = self.mixcloud._proper_result = Mock()
-        mock_proper_result.return_value = coroutine()
+        mock_proper_result = self.mixcloud._proper_result = AsyncMock(
+            return_value=xml)
         result = self.mixcloud.oembed('auser/amix', height=100, format='xml')
 
         url = urljoin(self.mixcloud._mixcloud_root, 'auser/amix')
         self.mock_session.get.assert_called_once_with(
             self.mixcloud._oembed_root,
             params={'url': url, 'height': 100, 'format': 'xml'})
-        mock_proper_result.assert_called_once_with(self.response_get)
+        mock_proper_result.assert_awaited_once_with(self.response_get)
         self.assertEqual(result, xml)
 
     def check_underscore_upload(self, params, data, access_token,
@@ -443,9 +373,9 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
         arguments.
         """
         self.mixcloud.access_token = access_token
-        response = self.configure_session_method(self.mock_session.post)
-        mock_native_result = self.mixcloud._native_result = Mock()
-        mock_native_result.return_value = self.coroutine()
+        response = self.configure_session_method('post')
+        mock_native_result = self.mixcloud._native_result = AsyncMock(
+            return_value=self.sample_access_dict())
 
         url = urljoin(self.mixcloud._api_root,
                       f'upload/?access_token={access_token}')
@@ -466,7 +396,7 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
                         {}, data._fields[1][-1]))
         self.assertIsInstance(call_data, aiohttp.FormData)
         self.assertEqual(call_data._fields, expected_fields)
-        mock_native_result.assert_called_once_with(response)
+        mock_native_result.assert_awaited_once_with(response)
         self.assert_access_dict_equal(result, self.sample_dict)
 
     def check_upload(self, access_token, method_name,
@@ -476,8 +406,8 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
         works correctly, using given arguments.
         """
         self.mixcloud.access_token = access_token
-        mock_upload = self.mixcloud._upload = Mock()
-        mock_upload.return_value = self.coroutine()
+        mock_upload = self.mixcloud._upload = AsyncMock(
+            return_value=self.sample_access_dict())
         method = getattr(self.mixcloud, method_name)
         result = method(*args, **kwargs)
 
@@ -496,12 +426,9 @@ class TestMixcloudSync(TestMixcloudMixin, VerboseTestCase):
 
     def test_close(self):
         """`MixcloudSync.close` must call `_session.close`."""
-        async def coroutine():
-            """Dummy coroutine function."""
-
-        mock_close = self.mixcloud._session.close = Mock()
-        mock_close.return_value = coroutine()
-        self.mixcloud.close()
+        with patch.object(self.mixcloud._session, 'close',
+                          new_callable=AsyncMock) as mock_close:
+            self.mixcloud.close()
         mock_close.assert_called_once_with()
 
     def test_delegate_special(self):
@@ -1,34 +1,55 @@
 import asyncio
-from functools import wraps
 
+from tests import LOOP
 from tests.verbose import VerboseTestCase
 
 
-def _synced(method):
-    """Return a blocking version of coroutine `method`."""
-    @wraps(method)
+def _synced(method, loop):
+    """Return a blocking version of coroutine `method`, running
+    on `loop`.
+    """
     def wrapper(*args, **kwargs):
         """Wait for coroutine `method` to complete and return
         its result.
         """
-        loop = asyncio.get_event_loop()
         return loop.run_until_complete(method(*args, **kwargs))
+
+    # Copy just the attributes test discovery and reporting rely on.
+    wrapper.__name__ = method.__name__
+    wrapper.__qualname__ = method.__qualname__
+    wrapper.__doc__ = method.__doc__
     return wrapper
 
 
 class SyncedTestCase(VerboseTestCase):
     """Testcase with all of its coroutine methods turned into
     synchronous (i.e blocking) methods, apart from those marked
-    for preserving.
+    for preserving.  Coroutine test methods are run to completion
+    as they get called by the test runner.  All of them run on the
+    same event loop, stored as :attr:`loop`.
     """
 
-    def __init__(self, *args):
+    def __init_subclass__(cls, **kwargs):
         """Turn all of coroutine methods into synchronous ones,
-        apart from those with an `_async` attribute.
+        apart from those with an `_async` attribute, once per class
+        rather than once per test instance.  Leave test methods
+        unwrapped, :meth:`_callTestMethod` runs them.  Store the
+        suite's event loop to run coroutines on.
         """
-        super().__init__(*args)
-        for name in dir(self):
-            attribute = getattr(self, name)
+        super().__init_subclass__(**kwargs)
+        cls.loop = LOOP
+        for name in dir(cls):
+            if name.startswith('test'):
+                continue
+            attribute = getattr(cls, name)
             if (asyncio.iscoroutinefunction(attribute)
                     and not hasattr(attribute, '_async')):
-                setattr(self, name, _synced(attribute))
+                setattr(cls, name, _synced(attribute, cls.loop))
+
+    def _callTestMethod(self, method):
+        """Call test `method`, running it to completion if it is
+        a coroutine.
+        """
+        result = method()
+        if asyncio.iscoroutine(result):
+            self.loop.run_until_complete(result)
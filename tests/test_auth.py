@@ -10,6 +10,10 @@ from tests.auth import TestMixcloudOAuthMixin, \
 from tests.synced import SyncedTestCase
 
 
+#: Expected URL of access token requests
+_ACCESS_TOKEN_URL = yarl.URL('https://www.mixcloud.com/oauth/access_token')
+
+
 class TestMixcloudOAuth(TestMixcloudOAuthMixin, SyncedTestCase):
     """Test `MixcloudOAuth`."""
 
@@ -32,10 +36,10 @@ class TestMixcloudOAuth(TestMixcloudOAuthMixin, SyncedTestCase):
             result = await auth.access_token('acb')
 
             mock_session.get.assert_called_once_with(
-                yarl.URL('https://www.mixcloud.com/oauth/access_token'),
+                _ACCESS_TOKEN_URL,
                 params={'client_id': 'ah3', 'redirect_uri': 'test.com',
                         'client_secret': 'uq8', 'code': 'acb'})
-            mock_session.close.assert_called_once_with()
+            mock_session.close.assert_awaited_once_with()
         self.assertEqual(result, 'k4jw')
 
     async def test_access_token_mixcloud_instance(self):
@@ -56,7 +60,7 @@ class TestMixcloudOAuth(TestMixcloudOAuthMixin, SyncedTestCase):
         result = await auth.access_token('nfe')
 
         mock_mixcloud._session.get.assert_called_once_with(
-            yarl.URL('https://www.mixcloud.com/oauth/access_token'),
+            _ACCESS_TOKEN_URL,
             params={'client_id': 'cj2', 'redirect_uri': 'foo.org',
                     'client_secret': '8k3', 'code': 'nfe'})
         self.assertEqual(result, 'j39m')
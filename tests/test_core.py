@@ -1,34 +1,32 @@
 import json
-import os
-from os.path import basename
-from pathlib import Path
-from tempfile import NamedTemporaryFile, mkstemp
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import aiohttp
 import yarl
 from multidict import MultiDict
 
 from aiomixcloud import Mixcloud, MixcloudError
+from aiomixcloud.constants import API_ROOT
 from aiomixcloud.models import AccessDict, Resource, ResourceList
 
 from tests.core import TestMixcloudMixin, urljoin
-from tests.mock import AsyncContextManagerMock
 from tests.synced import SyncedTestCase
 
 
-def shortcut_list_check(method):
-    """Return a wrapper that prepares before and tests after
-    awaiting `method`.
-    """
-    async def wrapper(self):
-        """Prepare test data, await `method` and assert about
-        its result.
-        """
-        self.shortcut_prepare()
-        result = await method(self)
-        self.assert_resource_list_equal(result)
-    return wrapper
+#: Expected URL of GET requests with an access token
+_GET_ACCESS_TOKEN_URL = yarl.URL(urljoin(
+    API_ROOT, 'foo/bar?metadata=1&access_token=fwp9'))
+
+#: Expected URL of GET requests with parameters
+_GET_PARAMS_URL = yarl.URL(urljoin(
+    API_ROOT, 'some/resource?foo=bar&height=3&metadata=1'))
+
+#: Expected URL of action requests
+_ACTION_URL = yarl.URL(urljoin(
+    API_ROOT, 'nick/mymix/favorite/?access_token=6he8'))
+
+#: Expected URL of embed requests
+_EMBED_URL = yarl.URL(urljoin(API_ROOT, 'auser/amix/embed-json'))
 
 
 class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
@@ -37,6 +35,7 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
     mixcloud_class = Mixcloud
     resource_class = Resource
     resource_list_class = ResourceList
+    custom_api_root = 'https://api.mc.com'
 
     async def test_pass_session(self):
         """`Mixcloud` must store a custom session, if one is passed
@@ -46,37 +45,57 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
         async with Mixcloud(session=session) as mixcloud:
             self.assertEqual(mixcloud._session, session)
 
+    async def test_session(self):
+        """`Mixcloud` must start a session of its own, when neither
+        a session nor a connector is passed during instantiation.
+        """
+        Mixcloud()
+        self.mock_session_class.assert_called_once_with()
+
+    async def test_pass_connector(self):
+        """`Mixcloud` instances must start their sessions on
+        a connector passed during instantiation, not owned by them,
+        so it can be shared.
+        """
+        connector = Mock()
+        Mixcloud(connector=connector)
+        Mixcloud(connector=connector)
+        self.assertEqual(
+            self.mock_session_class.call_args_list,
+            [call(connector=connector, connector_owner=False)] * 2)
+
+    async def test_pass_session_and_connector(self):
+        """`Mixcloud` must raise ValueError when passed both a session
+        and a connector.
+        """
+        with self.assertRaises(ValueError):
+            Mixcloud(session=Mock(), connector=Mock())
+        self.mock_session_class.assert_not_called()
+
     async def test_aexit(self):
         """`Mixcloud.__aexit__` must call `close`."""
-        async def coroutine():
-            """Dummy coroutine function."""
-
-        with patch('aiomixcloud.Mixcloud.close', autospec=True) as mock_close:
-            mock_close.return_value = coroutine()
-            async with Mixcloud() as mixcloud:
+        # Patching a coroutine function sets up an `AsyncMock`.
+        with patch.object(Mixcloud, 'close') as mock_close:
+            async with Mixcloud():
                 pass
-            mock_close.assert_called_once_with(mixcloud)
+            mock_close.assert_awaited_once_with()
 
     async def test_build_url_api_root(self):
         """`Mixcloud._build_url` must return an absolute URL consisting
         of `_api_root` and given argument, when using a custom
-        `_api_root`.
+        `_api_root`, returning the same object on repeated calls.
         """
-        async with Mixcloud('https://api.mc.com') as mixcloud:
-            for value, path in self.url_values:
+        async with Mixcloud(self.custom_api_root) as mixcloud:
+            for value, expected in self.custom_build_url_values:
                 result = mixcloud._build_url(value)
-                expected = f'https://api.mc.com/{path}'
-                self.assertEqual(result, yarl.URL(expected))
+                self.assertEqual(result, expected)
+                self.assertIs(mixcloud._build_url(value), result)
 
     async def test_process_response(self):
         """`Mixcloud._process_respose` must return a dict of
         received data.
         """
-        @self.configure_get_json
-        async def coroutine():
-            """Return sample dict."""
-            return self.sample_dict
-
+        self.set_get_json(self.sample_dict)
         result = await self.mixcloud._process_response(self.response_get)
         self.response_get.json.assert_called_once_with(
             loads=self.mixcloud._json_decode, content_type=None)
@@ -86,11 +105,7 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
         """`Mixcloud._process_respose` must return None when JSON
         decoding fails and `_raise_exceptions` is False.
         """
-        @self.configure_get_json
-        async def coroutine():
-            """Raise JSONDecodeError."""
-            json.loads('')
-
+        self.set_get_json(exception=self.json_decode_error)
         result = await self.mixcloud._process_response(self.response_get)
         self.assertIsNone(result)
 
@@ -98,11 +113,7 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
         """`Mixcloud._process_respose` must raise JSONDecodeError when
         JSON decoding fails and `_raise_exceptions` is True.
         """
-        @self.configure_get_json
-        async def coroutine():
-            """Raise JSONDecodeError."""
-            json.loads('')
-
+        self.set_get_json(exception=self.json_decode_error)
         async with Mixcloud(raise_exceptions=True) as mixcloud:
             with self.assertRaises(json.JSONDecodeError):
                 await mixcloud._process_response(self.response_get)
@@ -116,11 +127,7 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
         if expected is None:
             expected = value
 
-        @self.configure_get_json
-        async def coroutine():
-            """Return mock `_process_result`'s result."""
-            return value
-
+        self.set_get_json(value)
         result = await self.mixcloud.get(key)
 
         self.mock_session.get.assert_called_once_with(
@@ -128,6 +135,23 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
         self.assertIsInstance(result, result_type)
         self.assertEqual(result.data, expected)
 
+    async def test_get_custom_resource_class(self):
+        """`Mixcloud.get` must work with a custom resource class
+        keeping the signature of `Resource.__init__`.
+        """
+        class CustomResource(Resource):
+            def __init__(self, data, *, full=False,
+                         create_connections=True, mixcloud):
+                super().__init__(data, full=full,
+                                 create_connections=create_connections,
+                                 mixcloud=mixcloud)
+
+        self.set_get_json(self.sample_dict)
+        async with Mixcloud(resource_class=CustomResource) as mixcloud:
+            result = await mixcloud.get('rob')
+        self.assertIsInstance(result, CustomResource)
+        self.assertEqual(result.data, self.sample_dict)
+
     async def test_get_absolute(self):
         """`Mixcloud.get` must correctly handle absolute URLs."""
         values = [
@@ -137,56 +161,35 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
              'https://api.mixcloud.com/nick/cloudcasts?metadata=1'),
         ]
         for value, url in values:
-            @self.configure_get_json
-            async def coroutine():
-                """Dummy coroutine function."""
-
+            self.set_get_json()
             await self.mixcloud.get(value, relative=False)
 
-            self.mock_session.get.assert_called_with(
-                yarl.URL(url))
-        self.assertEqual(self.mock_session.get.call_count, len(values))
+        expected_calls = [call(yarl.URL(url)) for _, url in values]
+        self.assertEqual(self.mock_session.get.call_args_list, expected_calls)
 
     async def test_get_access_token(self):
         """`Mixcloud.get` must include access token as a GET parameter,
         if it is not None.
         """
-        @self.configure_get_json
-        async def coroutine():
-            """Dummy coroutine function."""
-
+        self.set_get_json()
         self.mixcloud.access_token = 'fwp9'
         await self.mixcloud.get('foo/bar')
-        expected = urljoin(
-            self.mixcloud._api_root,
-            'foo/bar?metadata=1&access_token=fwp9')
 
         self.mock_session.get.assert_called_once_with(
-            yarl.URL(expected))
+            _GET_ACCESS_TOKEN_URL)
 
     async def test_get_params(self):
         """`Mixcloud.get` must correctly handle GET parameters."""
-        @self.configure_get_json
-        async def coroutine():
-            """Dummy coroutine function."""
-
+        self.set_get_json()
         await self.mixcloud.get('some/resource', foo='bar', height=3)
-        expected = urljoin(
-            self.mixcloud._api_root,
-            'some/resource?foo=bar&height=3&metadata=1')
 
-        self.mock_session.get.assert_called_once_with(
-            yarl.URL(expected))
+        self.mock_session.get.assert_called_once_with(_GET_PARAMS_URL)
 
     async def test_get_error_raise_exception(self):
         """`Mixcloud.get` must raise a MixcloudError when received
         data has an 'error' key and `_raise_exceptions` is True.
         """
-        @self.configure_get_json
-        async def coroutine():
-            """Return mock `_process_result`'s expected result."""
-            return self.error_dict
-
+        self.set_get_json(self.error_dict)
         async with Mixcloud(raise_exceptions=True) as mixcloud:
             with self.assertRaises(MixcloudError):
                 await mixcloud.get('foo')
@@ -196,58 +199,48 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
 
     async def check_shortcut(self, method_name, called_with, *args):
         """Check that shortcut method `method_name` works correctly."""
-        async def coroutine():
-            """Return sample `Resource`."""
-            return Resource(self.sample_dict, mixcloud=self.mixcloud)
-
-        self.mixcloud.get = Mock()
-        self.mixcloud.get.return_value = coroutine()
+        mock_get = self.mixcloud.get = AsyncMock(
+            return_value=Resource(self.sample_dict, mixcloud=self.mixcloud))
         method = getattr(self.mixcloud, method_name)
         result = await method(*args)
 
-        self.mixcloud.get.assert_called_once_with(called_with)
+        mock_get.assert_awaited_once_with(called_with)
         self.assertIsInstance(result, Resource)
         self.assertEqual(result.data, self.sample_dict)
 
-    @shortcut_list_check
-    async def test_popular(self):
-        """`Mixcloud.popular` must return `Mixcloud.get` called with
-        appropriate parameters.
-        """
-        result = await self.mixcloud.popular(offset=30, limit=30)
-        self.mixcloud.get.assert_called_once_with(
-            'popular', offset=30, limit=30)
-        return result
-
-    @shortcut_list_check
-    async def test_hot(self):
-        """`Mixcloud.hot` must return `Mixcloud.get` called with
-        appropriate parameters.
+    async def check_list_shortcut(self, method_name, args,
+                                  kwargs, called_with):
+        """Check that list shortcut method `method_name`, when called
+        with `args` and `kwargs`, returns the result of `get` called
+        as described by `called_with`.
         """
-        result = await self.mixcloud.hot(page=3)
-        self.mixcloud.get.assert_called_once_with(
-            'popular/hot', offset=60, limit=20)
-        return result
-
-    @shortcut_list_check
-    async def test_new(self):
-        """`Mixcloud.new` must return `Mixcloud.get` called with
-        appropriate parameters.
-        """
-        result = await self.mixcloud.new(since=1000, until=100000)
-        self.mixcloud.get.assert_called_once_with(
-            'new', since=1000, until=100000)
-        return result
-
-    @shortcut_list_check
-    async def test_search(self):
-        """`Mixcloud.search` must return `Mixcloud.get` called with
-        appropriate parameters.
+        self.shortcut_prepare()
+        method = getattr(self.mixcloud, method_name)
+        result = await method(*args, **kwargs)
+
+        self.assertEqual(self.mock_get.call_args_list, [called_with])
+        self.assert_resource_list_equal(result)
+
+    check_list_shortcut._async = True
+
+    async def test_list_shortcuts(self):
+        """`Mixcloud.popular`, `hot`, `new` and `search` must return
+        `Mixcloud.get` called with appropriate parameters.
         """
-        result = await self.mixcloud.search('foo', offset=90, limit=45)
-        self.mixcloud.get.assert_called_once_with(
-            'search', q='foo', type='cloudcast', offset=90, limit=45)
-        return result
+        values = [
+            ('popular', (), {'offset': 30, 'limit': 30},
+             call('popular', offset=30, limit=30)),
+            ('hot', (), {'page': 3},
+             call('popular/hot', offset=60, limit=20)),
+            ('new', (), {'since': 1000, 'until': 100000},
+             call('new', since=1000, until=100000)),
+            ('search', ('foo',), {'offset': 90, 'limit': 45},
+             call('search', q='foo', type='cloudcast', offset=90, limit=45)),
+        ]
+        for method_name, args, kwargs, called_with in values:
+            with self.subTest(method=method_name):
+                await self.check_list_shortcut(
+                    method_name, args, kwargs, called_with)
 
     async def check_native_result(self, value, expected):
         """Check that `_native_result` goes through `_process_response`
@@ -256,7 +249,7 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
         self.prepare_process_response(value)
         result = await self.mixcloud._native_result('response')
 
-        self.mock_process_response.assert_called_once_with('response')
+        self.mock_process_response.assert_awaited_once_with('response')
         self.assert_access_dict_equal(result, expected)
 
     check_native_result._async = True
@@ -290,7 +283,7 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
 
         with self.assertRaises(MixcloudError):
             await self.mixcloud._native_result('response')
-        self.mock_process_response.assert_called_once_with('response')
+        self.mock_process_response.assert_awaited_once_with('response')
 
     async def test_do_action(self):
         """`Mixcloud._do_action` must, under normal circumstances,
@@ -299,23 +292,17 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
         """
         methods = ['post', 'delete']
         for method_name in methods:
-            async def coroutine():
-                """Return sample `AccessDict`."""
-                return AccessDict(self.sample_dict, mixcloud=self.mixcloud)
-
             method = getattr(self.mock_session, method_name)
-            response = self.configure_session_method(method)
+            response = self.configure_session_method(method_name)
             self.mixcloud.access_token = '6he8'
 
-            mock_native_result = self.mixcloud._native_result = Mock()
-            mock_native_result.return_value = coroutine()
+            mock_native_result = self.mixcloud._native_result = AsyncMock(
+                return_value=self.sample_access_dict())
             result = await self.mixcloud._do_action(
                 'nick/mymix', 'favorite', method_name)
-            expected_url = urljoin(self.mixcloud._api_root,
-                                   'nick/mymix/favorite/?access_token=6he8')
 
-            method.assert_called_once_with(yarl.URL(expected_url))
-            mock_native_result.assert_called_once_with(response)
+            method.assert_called_once_with(_ACTION_URL)
+            mock_native_result.assert_awaited_once_with(response)
             self.assert_access_dict_equal(result, self.sample_dict)
 
     async def test_do_action_failure(self):
@@ -329,12 +316,12 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
         """Check that `Mixcloud`'s HTTP `method` request about some
         action works corectly.
         """
-        mock_do_action = self.mixcloud._do_action = Mock()
-        mock_do_action.return_value = self.coroutine()
+        mock_do_action = self.mixcloud._do_action = AsyncMock(
+            return_value=self.sample_access_dict())
         method = getattr(self.mixcloud, f'_{method_name}_action')
         result = await method('foo', 'follow')
 
-        mock_do_action.assert_called_once_with('foo', 'follow', method_name)
+        mock_do_action.assert_awaited_once_with('foo', 'follow', method_name)
         self.assert_access_dict_equal(result, self.sample_dict)
 
     async def check_specific_action(self, method_name, action_name):
@@ -342,9 +329,8 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
         action `action_name` works correctly.
         """
         attribute = f'_{method_name}_action'
-        setattr(self.mixcloud, attribute, Mock())
-        mock_method = getattr(self.mixcloud, attribute)
-        mock_method.return_value = self.coroutine()
+        mock_method = AsyncMock(return_value=self.sample_access_dict())
+        setattr(self.mixcloud, attribute, mock_method)
         action = getattr(self.mixcloud, action_name)
         result = await action('test')
 
@@ -352,7 +338,7 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
             action_name = action_name[2:]
         action_name = action_name.replace('_', '-')
 
-        mock_method.assert_called_once_with('test', action_name)
+        mock_method.assert_awaited_once_with('test', action_name)
         self.assert_access_dict_equal(result, self.sample_dict)
 
     async def test_proper_result(self):
@@ -361,65 +347,56 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
         """
         mock_response = Mock()
         mock_response.headers = {'content-type': 'application/javascript'}
-        mock_native_result = self.mixcloud._native_result = Mock()
-        mock_native_result.return_value = self.coroutine()
+        mock_native_result = self.mixcloud._native_result = AsyncMock(
+            return_value=self.sample_access_dict())
         result = await self.mixcloud._proper_result(mock_response)
 
-        mock_native_result.assert_called_once_with(mock_response)
+        mock_native_result.assert_awaited_once_with(mock_response)
         self.assert_access_dict_equal(result, self.sample_dict)
 
     async def test_proper_result_text(self):
         """`Mixcloud._proper_result` must call response's `text` method
         when dealing with text data.
         """
-        async def coroutine():
-            """Return sample text."""
-            return 'sample'
-
         mock_response = Mock(headers={})
-        mock_response.text.return_value = coroutine()
+        mock_response.text = AsyncMock(return_value='sample')
         result = await self.mixcloud._proper_result(mock_response)
 
-        mock_response.text.assert_called_once_with()
+        mock_response.text.assert_awaited_once_with()
         self.assertEqual(result, 'sample')
 
     async def test_embed(self):
         """`Mixcloud._embed` must go through `_session.get` of the
         proper URL and call `_proper_result`.
         """
-        mock_proper_result = self.mixcloud._proper_result = Mock()
-        mock_proper_result.return_value = self.coroutine()
+        mock_proper_result = self.mixcloud._proper_result = AsyncMock(
+            return_value=self.sample_access_dict())
         result = await self.mixcloud._embed('auser/amix', height=60)
 
-        url = urljoin(self.mixcloud._api_root, 'auser/amix/embed-json')
         self.mock_session.get.assert_called_once_with(
-            yarl.URL(url), params={'height': 60})
+            _EMBED_URL, params={'height': 60})
+        mock_proper_result.assert_awaited_once_with(self.response_get)
         self.assert_access_dict_equal(result, self.sample_dict)
 
     async def test_embed_json(self):
         """`Mixcloud.embed_json` must call `_embed` with format='json'
         and any other arguments forwarded.
         """
-        mock_embed = self.mixcloud._embed = Mock()
-        mock_embed.return_value = self.coroutine()
+        mock_embed = self.mixcloud._embed = AsyncMock(
+            return_value=self.sample_access_dict())
         result = await self.mixcloud.embed_json(width=250)
 
-        mock_embed.assert_called_once_with(format='json', width=250)
+        mock_embed.assert_awaited_once_with(format='json', width=250)
         self.assert_access_dict_equal(result, self.sample_dict)
 
     async def test_embed_html(self):
         """`Mixcloud.embed_html` must call `_embed` with format='html'
         and any other arguments forwarded.
         """
-        async def coroutine():
-            """Return sample text."""
-            return 'test'
-
-        mock_embed = self.mixcloud._embed = Mock()
-        mock_embed.return_value = coroutine()
+        mock_embed = self.mixcloud._embed = AsyncMock(return_value='test')
         result = await self.mixcloud.embed_html(width=300)
 
-        mock_embed.assert_called_once_with(format='html', width=300)
+        mock_embed.assert_awaited_once_with(format='html', width=300)
         self.assertEqual(result, 'test')
 
     async def test_oembed(self):
@@ -428,12 +405,8 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
         """
         xml = '<?xml version="1.0" encoding="utf-8"?><oembed>foo</oembed>'
 
-        async def coroutine():
-            """Return sample XML."""
-            return xml
-
-        mock_proper_result = self.mixcloud._proper_result = Mock()
-        mock_proper_result.return_value = coroutine()
+        mock_proper_result = self.mixcloud._proper_result = AsyncMock(
+            return_value=xml)
         result = await self.mixcloud.oembed(
             'someuser/somemix', height=120, format='xml')
 
@@ -441,7 +414,7 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
         self.mock_session.get.assert_called_once_with(
             self.mixcloud._oembed_root,
             params={'url': url, 'height': 120, 'format': 'xml'})
-        mock_proper_result.assert_called_once_with(self.response_get)
+        mock_proper_result.assert_awaited_once_with(self.response_get)
         self.assertEqual(result, xml)
 
     async def check_underscore_upload(self, params, data, access_token,
@@ -450,9 +423,9 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
         arguments.
         """
         self.mixcloud.access_token = access_token
-        response = self.configure_session_method(self.mock_session.post)
-        mock_native_result = self.mixcloud._native_result = Mock()
-        mock_native_result.return_value = self.coroutine()
+        response = self.configure_session_method('post')
+        mock_native_result = self.mixcloud._native_result = AsyncMock(
+            return_value=self.sample_access_dict())
 
         url = urljoin(self.mixcloud._api_root,
                       f'upload/?access_token={access_token}')
@@ -473,7 +446,7 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
                         {}, data._fields[1][-1]))
         self.assertIsInstance(call_data, aiohttp.FormData)
         self.assertEqual(call_data._fields, expected_fields)
-        mock_native_result.assert_called_once_with(response)
+        mock_native_result.assert_awaited_once_with(response)
         self.assert_access_dict_equal(result, self.sample_dict)
 
     async def check_upload(self, access_token, method_name,
@@ -483,8 +456,8 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
         works correctly, using given arguments.
         """
         self.mixcloud.access_token = access_token
-        mock_upload = self.mixcloud._upload = Mock()
-        mock_upload.return_value = self.coroutine()
+        mock_upload = self.mixcloud._upload = AsyncMock(
+            return_value=self.sample_access_dict())
         method = getattr(self.mixcloud, method_name)
         result = await method(*args, **kwargs)
 
@@ -503,10 +476,7 @@ class TestMixcloud(TestMixcloudMixin, SyncedTestCase):
 
     async def test_close(self):
         """`Mixcloud.close` must call `_session.close`."""
-        async def coroutine():
-            """Dummy coroutine function."""
-
-        mock_close = self.mixcloud._session.close = Mock()
-        mock_close.return_value = coroutine()
-        await self.mixcloud.close()
+        with patch.object(self.mixcloud._session, 'close',
+                          new_callable=AsyncMock) as mock_close:
+            await self.mixcloud.close()
         mock_close.assert_called_once_with()
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 from dateutil.tz import tzlocal
 
@@ -7,11 +8,15 @@ from aiomixcloud.datetime import _to_datetime, format_datetime, to_timestamp
 from tests.verbose import VerboseTestCase
 
 
+#: Local timezone
+_LOCAL_TZ = tzlocal()
+
+
 def naive_to_utc(dt):
     """Convert and return given timezone-naive `dt` in UTC.
     Consider it being in the local timezone.
     """
-    aware_local = dt.replace(tzinfo=tzlocal())
+    aware_local = dt.replace(tzinfo=_LOCAL_TZ)
     return aware_local.astimezone(timezone.utc)
 
 
@@ -52,6 +57,27 @@ class TestDatetime(VerboseTestCase):
             expected = naive_to_utc(naive)
             self.assertEqual(_to_datetime(value), expected)
 
+    def test_to_datetime_str_not_cached(self):
+        """`_to_datetime` must parse a datetime-like str anew on every
+        call, as `dateutil` fills missing fields in from current date.
+        """
+        parsed = datetime(2019, 8, 21, 10, 30, tzinfo=timezone.utc)
+        with patch('dateutil.parser.parse',
+                   return_value=parsed) as mock_parse:
+            _to_datetime('10:30')
+            _to_datetime('10:30')
+        self.assertEqual(mock_parse.call_count, 2)
+
+    def test_to_datetime_str_api_format(self):
+        """`_to_datetime` must parse a "YYYY-MM-DDTHH:MM:SSZ" str
+        without falling back to `dateutil`.
+        """
+        with patch('dateutil.parser.parse') as mock_parse:
+            result = _to_datetime('2020-01-31T23:59:08Z')
+        mock_parse.assert_not_called()
+        expected = datetime(2020, 1, 31, 23, 59, 8, tzinfo=timezone.utc)
+        self.assertEqual(result, expected)
+
     def check_aware_values(self, values):
         """Check that `_to_datetime` returns a UTC `datetime` when
         called with timezone-aware values.
@@ -90,6 +116,23 @@ class TestDatetime(VerboseTestCase):
             with self.assertRaises(TypeError):
                 _to_datetime(value)
 
+    def test_to_datetime_failure_empty(self):
+        """`to_datetime` must raise TypeError when called with an empty
+        or whitespace-only str, without falling back to `dateutil`.
+        """
+        with patch('dateutil.parser.parse') as mock_parse:
+            for value in ['', '  ', b'\t']:
+                with self.assertRaises(TypeError):
+                    _to_datetime(value)
+        mock_parse.assert_not_called()
+
+    def test_to_datetime_str_no_digits(self):
+        """`_to_datetime` must parse datetime-like str containing
+        no digits.
+        """
+        for value in ['March', 'Monday']:
+            self.assertIsInstance(_to_datetime(value), datetime)
+
     def test_format_datetime(self):
         """`format_datetime` must return a string in
         the "YYYY-MM-DDTHH:MM:SSZ" format.
@@ -98,8 +141,23 @@ class TestDatetime(VerboseTestCase):
         result = format_datetime(value)
         self.assertEqual(result, '2019-03-04T20:23:17Z')
 
+    def test_format_datetime_microseconds(self):
+        """`format_datetime` must leave microseconds out."""
+        value = datetime(2019, 3, 4, 20, 23, 17, 5021, tzinfo=timezone.utc)
+        result = format_datetime(value)
+        self.assertEqual(result, '2019-03-04T20:23:17Z')
+
     def test_to_timestamp(self):
         """`to_timestamp` must return a UNIX timestamp."""
         value = datetime(2020, 6, 1, 18, 21, 1, tzinfo=timezone.utc)
         result = to_timestamp(value)
         self.assertEqual(result, 1591035661)
+
+    def test_to_timestamp_before_epoch(self):
+        """`to_timestamp` must truncate fractional seconds towards zero
+        for datetimes before the UNIX epoch.
+        """
+        value = datetime(1969, 12, 31, 23, 59, 58, 500000,
+                         tzinfo=timezone.utc)
+        result = to_timestamp(value)
+        self.assertEqual(result, -1)
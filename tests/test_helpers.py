@@ -1,4 +1,5 @@
 import asyncio
+import unittest
 
 from tests.mock import AsyncContextManagerMock
 from tests.synced import SyncedTestCase
@@ -41,6 +42,19 @@ class TestSyncedTestCase(SyncedTestCase):
 
         kept_asynchronous._async = True
 
+    class CoroutineTestClass(SyncedTestCase):
+        """Test class with coroutine test methods."""
+
+        async def test_run(self):
+            """Coroutine test method recording that its body ran."""
+            await asyncio.sleep(0)
+            self.ran = True
+
+        async def test_fail(self):
+            """Coroutine test method failing after awaiting."""
+            await asyncio.sleep(0)
+            self.fail('coroutine test body ran')
+
     @classmethod
     def setUpClass(cls):
         """Store test class instance."""
@@ -71,6 +85,26 @@ class TestSyncedTestCase(SyncedTestCase):
         result = await self.test.kept_asynchronous()
         self.assertEqual(result, 3)
 
+    def test_coroutine_test_run(self):
+        """`SyncedTestCase`'s coroutine test methods must be run
+        to completion by the test runner.
+        """
+        test = self.CoroutineTestClass('test_run')
+        result = unittest.TestResult()
+        test.run(result)
+        self.assertTrue(result.wasSuccessful())
+        self.assertTrue(getattr(test, 'ran', False))
+
+    def test_coroutine_test_fail(self):
+        """Failures of `SyncedTestCase`'s coroutine test methods must
+        be reported by the test runner.
+        """
+        test = self.CoroutineTestClass('test_fail')
+        result = unittest.TestResult()
+        test.run(result)
+        self.assertEqual(len(result.failures), 1)
+        self.assertIn('coroutine test body ran', result.failures[0][1])
+
 
 class TestVerboseTestCase(VerboseTestCase):
     """Test `VerboseTestCase`."""
@@ -93,3 +127,17 @@ class TestVerboseTestCase(VerboseTestCase):
         self.assertEqual(result, 'This is a multiline docstring '
                                  'of a test method.\nHere comes the '
                                  'second line of the docstring.')
+
+    def test_short_description_cached(self):
+        """`VerboseTestCase.shortDescription` must format each
+        docstring only once.
+        """
+        class TestClass(VerboseTestCase):
+            """Test class inheriting from `VerboseTestCase`."""
+
+            def test_method(self):
+                """Docstring of a test method, asked for twice.
+                """
+
+        test = TestClass('test_method')
+        self.assertIs(test.shortDescription(), test.shortDescription())
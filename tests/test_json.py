@@ -1,8 +1,10 @@
 from datetime import datetime, timezone
-from pathlib import Path
+from json import JSONDecodeError
+from unittest.mock import patch
 
 from aiomixcloud.json import MixcloudJSONDecoder
 
+from tests import FIXTURES
 from tests.verbose import VerboseTestCase
 
 
@@ -35,7 +37,7 @@ class TestMixcloudJSONDecoder(VerboseTestCase):
         or not) correctly when both kinds are present in the encoded
         data.
         """
-        filename = Path('tests') / 'fixtures' / 'favorites.json'
+        filename = FIXTURES / 'favorites.json'
         with filename.open() as f:
             data = f.read()
         result = self.decoder.decode(data)
@@ -45,3 +47,30 @@ class TestMixcloudJSONDecoder(VerboseTestCase):
         expected_datetime = datetime(
             2017, 1, 4, 9, 56, 10, tzinfo=timezone.utc)
         self.assertEqual(result['data'][1]['created_time'], expected_datetime)
+
+    def test_nested(self):
+        """`MixcloudJSONDecoder` must decode datetime-like strings
+        nested in objects and lists.
+        """
+        result = self.decoder.decode(
+            '{"a": [{"b": {"c": "2019-02-03T04:22:18Z"}}, 7]}')
+        expected = datetime(2019, 2, 3, 4, 22, 18, tzinfo=timezone.utc)
+        self.assertEqual(result['a'][0]['b']['c'], expected)
+        self.assertEqual(result['a'][1], 7)
+
+    def test_invalid(self):
+        """`MixcloudJSONDecoder` must raise JSONDecodeError when given
+        invalid JSON data.
+        """
+        with self.assertRaises(JSONDecodeError):
+            self.decoder.decode('{"foo": ')
+
+    def test_non_str_skip_parse(self):
+        """`MixcloudJSONDecoder` must not try to parse non-string
+        values as datetimes.
+        """
+        with patch('dateutil.parser.parse') as parse:
+            result = self.decoder.decode(
+                '{"a": 1, "b": 2.5, "c": true, "d": null}')
+        parse.assert_not_called()
+        self.assertEqual(result, {'a': 1, 'b': 2.5, 'c': True, 'd': None})
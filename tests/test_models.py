@@ -1,33 +1,65 @@
+import asyncio
 import json
 from collections import UserDict, UserList
-from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, call
 
 from aiomixcloud.core import Mixcloud
 from aiomixcloud.models import AccessDict, AccessList, \
                                Resource, ResourceList, _WrapMixin
 
+from tests import FIXTURES
 from tests.synced import SyncedTestCase
 from tests.verbose import VerboseTestCase
 
 
+#: Names of the `Mixcloud` "targeting" methods
+TARGETING_METHODS = (
+    'follow', 'favorite', 'repost', 'listen_later',
+    'unfollow', 'unfavorite', 'unrepost', 'unlisten_later',
+    'embed_json', 'embed_html', 'oembed', 'edit',
+)
+
+
+async def _create_mixcloud():
+    """Return a new `Mixcloud` instance.  Sessions need a running event
+    loop to be created in.
+    """
+    return Mixcloud()
+
+
+class FakeMixcloud:
+    """Bare `Mixcloud` stand-in, with just the resource class
+    needed for wrapping data.  Test cases making requests give it
+    a `get` method.
+    """
+
+    __slots__ = ('get',)
+
+    _resource_class = Resource
+
+
 class MixcloudTestCaseMixin:
-    """Testcase mixin with a mock Mixcloud instance available."""
+    """Testcase mixin with a fake Mixcloud instance available."""
 
     def setUp(self):
-        """Store a mock Mixcloud instance."""
-        self.mixcloud = Mock(_resource_class=Resource)
+        """Store a fake Mixcloud instance."""
+        self.mixcloud = FakeMixcloud()
 
 
 class MixcloudTestCase(MixcloudTestCaseMixin, VerboseTestCase):
-    """Testcase with a mock Mixcloud instance available."""
+    """Testcase with a fake Mixcloud instance available."""
 
 
 class MixcloudSyncedTestCase(MixcloudTestCaseMixin, SyncedTestCase):
-    """Testcase with a mock Mixcloud instance available and all of its
+    """Testcase with a fake Mixcloud instance available and all of its
     coroutine methods turned into synchronous ones.
     """
 
+    def setUp(self):
+        """Give the fake Mixcloud instance a mock `get` method."""
+        super().setUp()
+        self.mixcloud.get = AsyncMock()
+
 
 class Wrap(_WrapMixin):
     """`_WrapMixin` trivial implementation."""
@@ -50,80 +82,63 @@ class TestWrapMixin(MixcloudTestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Store test data."""
-        cls.expected = [int, str, AccessList, AccessDict, Resource]
-
-    def test_wrap(self):
-        """`_WrapMixin._wrap` must return correct data types
-        for each input.
+        """Store test data and build wrappers once, since wrapping
+        happens on access and leaves their data unchanged.
         """
-        wrap = Wrap(self.mixcloud)
-        data = [
+        cls.expected = (int, str, AccessList, AccessDict, Resource)
+        mixcloud = FakeMixcloud()
+        cls.wrap = Wrap(mixcloud)
+        cls.wrap_data = (
             9,
             'test',
             [1, 3, 2],
             {'foo': 'bar', 'one': 'two'},
             {'name': 'Aristotelis', 'type': 'user'},
-        ]
-
-        for i, value in enumerate(data):
-            wrapped = wrap._wrap(value)
-            expected_type = self.expected[i]
-            self.assertIsInstance(wrapped, expected_type)
-
-    def test_iteration(self):
-        """`_WrapMixin` must yield data of correct types when being
-        iterated over.
-        """
-        data = [
+        )
+        cls.iteration_list = WrapList([
             -3,
             'foo',
             [8, 0, 4, -2],
             {'test': 12, 'baz': 15},
             {'key': 'somekey', 'type': 'comment'},
-        ]
-        wrap_list = WrapList(data, mixcloud=self.mixcloud)
-
-        for i, wrapped in enumerate(wrap_list):
-            expected_type = self.expected[i]
-            self.assertIsInstance(wrapped, expected_type)
-
-    def test_indexing_sequence(self):
-        """`_WrapMixin` must return correct data types when being
-        indexed as a sequence.
-        """
-        data = [
+        ], mixcloud=mixcloud)
+        cls.sequence_list = WrapList([
             8,
             'hello',
             [2, 2, -1, 14],
             {'foo1': True, '4bar': False},
             {'description': 'this is the description',
              'type': 'cloudcast', 'tags': ['jazz', 'funk']},
-        ]
-        wrap_list = WrapList(data, mixcloud=self.mixcloud)
-
-        for i, expected_type in enumerate(self.expected):
-            wrapped = wrap_list[i]
-            self.assertIsInstance(wrapped, expected_type)
-
-    def test_indexing_mapping(self):
-        """`_WrapMixin` must return correct data types when being
-        indexed as a mapping.
-        """
-        data = {
+        ], mixcloud=mixcloud)
+        cls.mapping_dict = WrapDict({
             'aa': 21,
             'b': 'hi',
             'check': [3, 41],
             'eee': {'foo': 'test', 'f': -5},
             'xyz': {'key': 'akey', 'type': 'tag'},
-        }
-        wrap_dict = WrapDict(data, mixcloud=self.mixcloud)
+        }, mixcloud=mixcloud)
+        # Keys in the order of their values' expected types.
+        cls.mapping_keys = sorted(cls.mapping_dict.keys())
 
-        sorted_keys = sorted(data.keys())
-        for i, key in enumerate(sorted_keys):
-            wrapped = wrap_dict[key]
-            expected_type = self.expected[i]
-            self.assertIsInstance(wrapped, expected_type)
+    def test_wrap(self):
+        """`_WrapMixin` must return data of correct types when wrapping
+        values, when being iterated over and when being indexed as
+        a sequence or as a mapping.
+        """
+        accesses = {
+            'wrap': [self.wrap._wrap(value) for value in self.wrap_data],
+            'iteration': list(self.iteration_list),
+            'sequence indexing': [self.sequence_list[i]
+                                  for i in range(len(self.expected))],
+            'mapping indexing': [self.mapping_dict[key]
+                                 for key in self.mapping_keys],
+        }
+        for access, wrapped_values in accesses.items():
+            with self.subTest(access=access):
+                self.assertEqual(len(wrapped_values), len(self.expected))
+                for wrapped, expected_type in zip(wrapped_values,
+                                                  self.expected):
+                    self.assertIsInstance(wrapped, expected_type)
 
 
 class TestAccessDict(MixcloudTestCase):
@@ -171,6 +186,20 @@ class TestAccessDict(MixcloudTestCase):
         value = self.access_dict.bar
         self.assertEqual(value, 15)
 
+    def test_copy(self):
+        """`AccessDict` must store a copy of given data and wrap
+        copies of nested items, so changes do not reach the caller's
+        `dict`.
+        """
+        data = {'foo': 3}
+        access_dict = AccessDict(data, mixcloud=self.mixcloud)
+        access_dict['foo'] = 9
+        self.assertEqual(data, {'foo': 3})
+
+        nested = {'bar': {'baz': 1}}
+        AccessDict(nested, mixcloud=self.mixcloud)['bar']['baz'] = 2
+        self.assertEqual(nested, {'bar': {'baz': 1}})
+
 
 class TestAccessList(MixcloudTestCase):
     """Test `AccessList`."""
@@ -199,11 +228,10 @@ class TestAccessList(MixcloudTestCase):
         """`AccessList must return `Resource`-like item with given
         `str` key as a key.
         """
+        expected = {'name': 'Some User', 'key': '/someuser/', 'type': 'user'}
         for key in ('someuser', 'someuser/', '/someuser'):
-            value = self.access_list[key]
-            self.assertEqual(
-                value, {'name': 'Some User',
-                        'key': '/someuser/', 'type': 'user'})
+            with self.subTest(key=key):
+                self.assertEqual(self.access_list[key], expected)
 
     def test_str_index_failure(self):
         """`AccessList must raise KeyError when accessed with str
@@ -212,29 +240,57 @@ class TestAccessList(MixcloudTestCase):
         with self.assertRaises(KeyError):
             self.access_list['missing']
 
+    def test_copy(self):
+        """`AccessList` must store a copy of given data, so changes
+        to it do not reach the caller's `list`.
+        """
+        data = [1, 2]
+        access_list = AccessList(data, mixcloud=self.mixcloud)
+        access_list.append(3)
+        self.assertEqual(data, [1, 2])
+
 
 class TestResource(MixcloudSyncedTestCase):
     """Test `Resource`."""
 
     @classmethod
     def setUpClass(cls):
-        """Store test data for `Resource.load` tests."""
+        """Store test data for `Resource.load` tests and for
+        a resource with "connections", load JSON fixtures of those
+        once and create a `Mixcloud` instance shared by all tests.
+        """
         cls.data = {'username': 'john', 'name': 'John Fooer',
                     'key': '/john/', 'type': 'user', 'cloudcast_count': 6}
+        cls.incomplete_data = {key: value for key, value in cls.data.items()
+                               if key != 'cloudcast_count'}
+        # `Resource.load` only reads the resource it downloads.
+        cls.full_resource = Resource(
+            cls.data, full=True, mixcloud=FakeMixcloud())
+        cls.user_root = 'https://api.mixcloud.com/bob/'
+        cls.connections = ('comments', 'followers', 'favorites')
+        cls.resource_data = {
+            'username': 'bob', 'city': 'London', 'key': '/bob/',
+            'metadata': {
+                'connections': {
+                    connection: f'{cls.user_root}{connection}/'
+                    for connection in cls.connections}},
+            'type': 'user'}
+        cls.connection_data = {
+            connection: json.loads(
+                (FIXTURES / f'{connection}.json').read_bytes())
+            for connection in cls.connections}
+        cls.shared_mixcloud = cls.loop.run_until_complete(_create_mixcloud())
+
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared `Mixcloud` instance."""
+        cls.loop.run_until_complete(cls.shared_mixcloud.close())
 
     def setUp(self):
-        """Store test data."""
+        """Store a `Resource` with "connections"."""
         super().setUp()
-        self.user_root = 'https://api.mixcloud.com/bob/'
-        data = {'username': 'bob', 'city': 'London', 'key': '/bob/',
-                'metadata': {
-                    'connections': {
-                        'comments': f'{self.user_root}comments/',
-                        'followers': f'{self.user_root}followers/',
-                        'favorites': f'{self.user_root}favorites/'}},
-                'type': 'user'}
-        self.resource = Resource(data, full=True, mixcloud=self.mixcloud)
-        self.connections = data['metadata']['connections'].keys()
+        self.resource = Resource(self.resource_data, full=True,
+                                 mixcloud=self.mixcloud)
 
     def test_repr(self):
         """`Resource` must have a proper representation."""
@@ -245,24 +301,19 @@ class TestResource(MixcloudSyncedTestCase):
         """The "targeting" methods must be available as
         `Resource` methods.
         """
-        actions = ['follow', 'favorite', 'repost', 'listen_later']
-        undo_actions = [f'un{action}' for action in actions]
-        targeting = (actions + undo_actions
-                     + ['embed_json', 'embed_html', 'oembed', 'edit'])
-
-        for t in targeting:
+        self.resource.mixcloud = self.shared_mixcloud
+        for t in TARGETING_METHODS:
             method = getattr(self.resource, t)
             self.assertTrue(callable(method))
 
-    async def test_targeting_failure(self):
+    def test_targeting_failure(self):
         """`Resource` must raise AttributeError when accessed with
         a missing attribute which is not included in the "targeting"
         methods.
         """
-        async with Mixcloud() as mixcloud:
-            self.resource.mixcloud = mixcloud
-            with self.assertRaises(AttributeError):
-                self.resource.not_there
+        self.resource.mixcloud = self.shared_mixcloud
+        with self.assertRaises(AttributeError):
+            self.resource.not_there
 
     def test_connections_existence(self):
         """`Resource` must have methods corresponding to
@@ -276,27 +327,23 @@ class TestResource(MixcloudSyncedTestCase):
         """`Resource`'s "connections" must return a `ResourceList`
         of respective `Resource`s.
         """
-        for connection in self.connections:
-            method = getattr(self.resource, connection)
-
-            filename = Path('tests') / 'fixtures' / f'{connection}.json'
-            with filename.open() as f:
-                data = json.load(f)
-            expected_resource_list = ResourceList(
-                data, mixcloud=self.mixcloud)
-
-            async def mock_get():
-                """Return a `ResourceList` appropriate
-                for `connection`.
-                """
-                return expected_resource_list
-
-            self.mixcloud.get = Mock()
-            self.mixcloud.get.return_value = mock_get()
-
-            resource_list = await method()
-            self.mixcloud.get.assert_called_once_with(
-                f'{self.user_root}{connection}/', relative=False)
+        expected_resource_lists = {
+            f'{self.user_root}{connection}/': ResourceList(
+                self.connection_data[connection], mixcloud=self.mixcloud)
+            for connection in self.connections}
+        self.mixcloud.get.side_effect = (
+            lambda url, **kwargs: expected_resource_lists[url])
+
+        # Mocked requests do not block, await all of them at once.
+        resource_lists = await asyncio.gather(
+            *[getattr(self.resource, connection)()
+              for connection in self.connections])
+
+        self.assertCountEqual(
+            self.mixcloud.get.await_args_list,
+            [call(url, relative=False) for url in expected_resource_lists])
+        for resource_list, expected_resource_list in zip(
+                resource_lists, expected_resource_lists.values()):
             self.assertIsInstance(resource_list, ResourceList)
             self.assertEqual(resource_list.data, expected_resource_list.data)
 
@@ -304,20 +351,13 @@ class TestResource(MixcloudSyncedTestCase):
         """`Resource.load` must load all the available data, mark self
         as "full" and return it.
         """
-        async def mock_get():
-            """Return a `Resource` with more data, marked as "full"."""
-            return Resource(self.data, full=True, mixcloud=self.mixcloud)
-
-        self.mixcloud.get.return_value = mock_get()
-
-        incomplete_data = self.data.copy()
-        del incomplete_data['cloudcast_count']
+        self.mixcloud.get.return_value = self.full_resource
 
-        resource = Resource(incomplete_data, mixcloud=self.mixcloud)
+        resource = Resource(self.incomplete_data, mixcloud=self.mixcloud)
         result = await resource.load()
 
-        self.mixcloud.get.assert_called_once_with(
-            '/john/', create_connections=False)
+        self.assertEqual(self.mixcloud.get.await_args_list,
+                         [call('/john/', create_connections=False)])
         self.assertTrue(result._full)
         self.assertEqual(result.data, self.data)
         self.assertIs(result, resource)
@@ -328,31 +368,32 @@ class TestResource(MixcloudSyncedTestCase):
         """
         resource = Resource(self.data, full=True, mixcloud=self.mixcloud)
 
-        async def mock_get():
-            """Return the same `Resource`."""
-            return resource
-
-        self.mixcloud.get.return_value = mock_get()
+        self.mixcloud.get.return_value = resource
 
         await resource.load()
-        self.mixcloud.get.assert_not_called()
+        self.assertEqual(self.mixcloud.get.await_args_list, [])
         self.assertEqual(resource.data, self.data)
 
         await resource.load(force=True)
-        self.mixcloud.get.assert_called_once_with(
-            '/john/', create_connections=False)
+        self.assertEqual(self.mixcloud.get.await_args_list,
+                         [call('/john/', create_connections=False)])
         self.assertEqual(resource.data, self.data)
 
 
 class TestResourceList(MixcloudSyncedTestCase):
     """Test `ResourceList`."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Load JSON fixture once."""
+        cls.comments_data = json.loads(
+            (FIXTURES / 'comments.json').read_bytes())
+
     def setUp(self):
         """Store test data."""
         super().setUp()
-        filename = Path('tests') / 'fixtures' / 'comments.json'
-        with filename.open() as f:
-            self.data = json.load(f)
+        # Shared by all tests, those removing items work on copies.
+        self.data = self.comments_data
         self.resource_list = ResourceList(self.data, mixcloud=self.mixcloud)
 
     def test_getitem_found(self):
@@ -406,8 +447,9 @@ class TestResourceList(MixcloudSyncedTestCase):
         value = repr(self.resource_list)
         self.assertEqual(value, '<ResourceList "Comments on Bob\'s profile">')
 
-        del self.data['name']
-        resource_list = ResourceList(self.data, mixcloud=self.mixcloud)
+        data = dict(self.data)
+        del data['name']
+        resource_list = ResourceList(data, mixcloud=self.mixcloud)
 
         value = repr(resource_list)
         self.assertEqual(value, '<ResourceList>')
@@ -418,50 +460,42 @@ class TestResourceList(MixcloudSyncedTestCase):
         the corresponding page.
         """
         url = self.data['paging'][where]
-
-        async def mock_get():
-            """Return a `ResourceList` of adjacent page."""
-            return self.resource_list
-
-        self.mixcloud.get.return_value = mock_get()
+        # Runs once per direction in the same test, forget the other.
+        self.mixcloud.get.reset_mock()
+        self.mixcloud.get.return_value = self.resource_list
 
         method = getattr(self.resource_list, where)
         result = await method()
-        self.mixcloud.get.assert_called_once_with(url, relative=False)
+        self.assertEqual(self.mixcloud.get.await_args_list,
+                         [call(url, relative=False)])
         self.assertIsInstance(result, ResourceList)
         self.assertEqual(result.data, self.resource_list.data)
 
-    def test_previous(self):
-        """`ResourceList.previous` must return a `ResourceList`
-        containing data from the previous page.
+    def test_navigation(self):
+        """`ResourceList.previous` and `ResourceList.next` must return
+        a `ResourceList` containing data from the previous and the next
+        page respectively.
         """
-        self.check_navigation('previous')
-
-    def test_next(self):
-        """`ResourceList.next` must return a `ResourceList` containing
-        data from the next page.
-        """
-        self.check_navigation('next')
+        for where in ['previous', 'next']:
+            with self.subTest(where=where):
+                self.check_navigation(where)
 
     async def check_navigation_missing(self, where):
         """Check that `ResourceList`'s navigation method indicated
         by `where` returns None when the corresponding navigation
         URL is missing.
         """
-        del self.data['paging'][where]
-        resource_list = ResourceList(self.data, mixcloud=self.mixcloud)
+        data = dict(self.data, paging=dict(self.data['paging']))
+        del data['paging'][where]
+        resource_list = ResourceList(data, mixcloud=self.mixcloud)
         method = getattr(resource_list, where)
         result = await method()
         self.assertIsNone(result)
 
-    def test_previous_missing(self):
-        """Check that `ResourceList.previous` returns None when the
-        "previous" navigation URL is missing.
-        """
-        self.check_navigation_missing('previous')
-
-    def test_next_missing(self):
-        """Check that `ResourceList.next` returns None when the "next"
-        navigation URL is missing.
+    def test_navigation_missing(self):
+        """Check that `ResourceList.previous` and `ResourceList.next`
+        return None when the respective navigation URL is missing.
         """
-        self.check_navigation_missing('next')
+        for where in ['previous', 'next']:
+            with self.subTest(where=where):
+                self.check_navigation_missing(where)
@@ -1,4 +1,14 @@
 import unittest
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _format_doc(doc):
+    """Strip leading whitespace from each line of `doc` and return
+    the concatenated result, leaving out the last, blank, line.
+    """
+    lines = [line.lstrip() for line in doc.splitlines()]
+    return '\n'.join(lines[:-1])
 
 
 class VerboseTestCase(unittest.TestCase):
@@ -7,9 +17,8 @@ class VerboseTestCase(unittest.TestCase):
     """
 
     def shortDescription(self):
-        """Take the whole currently tested method's docstring, strip
-        leading whitespace from each of its lines and return the
-        concatenated result, leaving out the last, blank, line.
+        """Return the currently tested method's whole docstring,
+        formatted once per docstring, as the runner may ask for
+        it more than once.
         """
-        lines = [line.lstrip() for line in self._testMethodDoc.splitlines()]
-        return '\n'.join(lines[:-1])
+        return _format_doc(self._testMethodDoc)